@@ -6,16 +6,26 @@ Files are stored in Vercel's writable `/tmp/uploads` directory.
 """
 
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Query # type: ignore
-from fastapi.responses import FileResponse # type: ignore
+from fastapi.responses import FileResponse, ORJSONResponse, Response # type: ignore
 from fastapi.middleware.cors import CORSMiddleware # type: ignore
-from sqlalchemy.orm import Session # type: ignore
+from fastapi.concurrency import run_in_threadpool # type: ignore
+from anyio import to_thread # type: ignore
+from sqlalchemy import select, func, insert # type: ignore
+from sqlalchemy.ext.asyncio import AsyncSession # type: ignore
+from sqlalchemy.orm import load_only, selectinload # type: ignore
 from typing import List, Optional
 from datetime import datetime
 from pathlib import Path
+import asyncio
+import errno
 import os
 import shutil
+import threading
+import time
 import uuid
 
+import orjson # type: ignore
+
 # Import database session, models, and schemas
 from database import get_db, Base, engine
 import models
@@ -25,27 +35,82 @@ import schemas
 UPLOAD_DIR = Path("/tmp/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# Hot-path bindings: destination paths are plain strings so each upload
+# skips a Path allocation, and the utcnow lookup is resolved once
+_UPLOAD_DIR_STR = str(UPLOAD_DIR)
+_utcnow = datetime.utcnow
+
+# In-process cache for the /api/questions payload; the seeded questions are
+# effectively immutable, so a warm hit skips the database entirely. Each
+# worker holds its own copy — the TTL alone bounds staleness after an edit.
+QUESTIONS_CACHE_TTL = 300  # seconds
+_questions_cache = None  # (monotonic timestamp, serialized JSON body)
+_questions_cache_lock = threading.Lock()
+
+# 1 MiB copy buffer; sequential copies are noticeably faster than with
+# shutil's default 64 KiB buffer
+COPY_BUFSIZE = 1024 * 1024
+
+def _save_upload(src, out):
+    """
+    Copy an upload's backing file object to an open destination file.
+
+    Takes the zero-copy os.sendfile path when the spooled temp file has
+    rolled over to disk, falling back to a buffered copy otherwise.
+    """
+    if getattr(src, "_rolled", False):
+        offset = 0
+        try:
+            size = os.fstat(src.fileno()).st_size
+            while offset < size:
+                sent = os.sendfile(out.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except OSError as exc:
+            # Fall back only when sendfile is unsupported and nothing has
+            # been transferred yet; a mid-copy failure is a real error, and
+            # appending a fresh copy after sent bytes would corrupt the file
+            if offset or exc.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+            out.seek(0)
+            out.truncate()
+            src.seek(0)
+    shutil.copyfileobj(src, out, COPY_BUFSIZE)
+
 # Initialize FastAPI
 app = FastAPI(
     title="Survey API",
-    description="API for survey application"
+    description="API for survey application",
+    default_response_class=ORJSONResponse
 )
 
 origins = [
     "http://localhost:5173",
-    "https://simple-survey-client-lilac.vercel.app",
+    os.getenv("FRONTEND_ORIGIN", "https://simple-survey-client-lilac.vercel.app"),
 ]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["https://simple-survey-client-lilac.vercel.app"],  # Specific allowed origin
+    allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "PUT", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,  # let browsers cache preflight results for a day
 )
 
-# Create database tables on startup
-Base.metadata.create_all(bind=engine)
+# One-time initialization once the event loop is up; table creation can be
+# skipped with CREATE_TABLES=0 when the schema is known to exist, sparing
+# the schema-inspection round-trips on serverless cold starts
+@app.on_event("startup")
+async def init_db():
+    # Raise the anyio threadpool limit (default 40) so bursts of blocking
+    # work (file copies, any sync handlers) don't queue behind each other
+    to_thread.current_default_thread_limiter().total_tokens = 100
+    if os.getenv("CREATE_TABLES", "1") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
 
 @app.get("/")
 def read_root():
@@ -56,17 +121,29 @@ def read_root():
     return {"message": "Survey API is running"}
 
 @app.get("/api/questions", response_model=schemas.QuestionList)
-def get_questions(db: Session = Depends(get_db)):
+async def get_questions(db: AsyncSession = Depends(get_db)):
     """
     Fetch all survey questions from the database.
 
     Args:
-        db (Session): SQLAlchemy database session.
+        db (AsyncSession): SQLAlchemy async database session.
 
     Returns:
         dict: Dictionary containing list of questions with options or file properties.
     """
-    db_questions = db.query(models.Question).order_by(models.Question.id).all()
+    global _questions_cache
+
+    cached = _questions_cache
+    if cached and time.monotonic() - cached[0] < QUESTIONS_CACHE_TTL:
+        return Response(content=cached[1], media_type="application/json")
+
+    db_questions = (
+        await db.execute(
+            select(models.Question)
+            .options(selectinload(models.Question.options))
+            .order_by(models.Question.id)
+        )
+    ).scalars().all()
     questions = []
 
     for q in db_questions:
@@ -79,10 +156,9 @@ def get_questions(db: Session = Depends(get_db)):
         }
 
         if q.type == "choice":
-            opts = db.query(models.QuestionOption).filter_by(question_id=q.id).all()
             item["options"] = {
                 "multiple": "yes" if q.multiple_choice else "no",
-                "option": [{"value": o.value, "text": o.text} for o in opts]
+                "option": [{"value": o.value, "text": o.text} for o in q.options]
             }
 
         if q.type == "file":
@@ -95,7 +171,11 @@ def get_questions(db: Session = Depends(get_db)):
 
         questions.append(item)
 
-    return {"question": questions}
+    body = orjson.dumps({"question": questions})
+    with _questions_cache_lock:
+        _questions_cache = (time.monotonic(), body)
+
+    return Response(content=body, media_type="application/json")
 
 @app.put("/api/questions/responses", response_model=schemas.QuestionResponse)
 async def submit_response(
@@ -105,7 +185,7 @@ async def submit_response(
     gender: str = Form(...),
     programming_stack: str = Form(...),
     certificates: List[UploadFile] = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Submit a survey response and save uploaded PDF certificates.
@@ -117,7 +197,7 @@ async def submit_response(
         gender (str): Respondent's gender.
         programming_stack (str): Comma-separated programming technologies.
         certificates (List[UploadFile]): List of PDF files uploaded.
-        db (Session): SQLAlchemy database session.
+        db (AsyncSession): SQLAlchemy async database session.
 
     Raises:
         HTTPException: If uploaded file is not a PDF.
@@ -125,37 +205,65 @@ async def submit_response(
     Returns:
         dict: Submitted response data including saved certificate filenames.
     """
+    # Reject bad uploads before touching the disk or the database, so a
+    # malformed file later in the list can't leave orphan rows or partial files
+    for cert in certificates:
+        if not cert.filename or not cert.filename.lower().endswith(".pdf"):
+            raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+
     resp = models.Response(
         full_name=full_name,
         email_address=email_address,
         description=description,
         gender=gender,
         programming_stack=programming_stack,
-        date_responded=datetime.utcnow()
+        date_responded=_utcnow()
     )
     db.add(resp)
-    db.flush()
-
-    saved_filenames = []
-    for cert in certificates:
-        ext = os.path.splitext(cert.filename)[1].lower()
-        if ext != ".pdf":
-            raise HTTPException(status_code=400, detail="Only PDF files are allowed")
-
-        unique_name = f"{uuid.uuid4()}{ext}"
-        dest = UPLOAD_DIR / unique_name
-        with open(dest, "wb") as out:
-            shutil.copyfileobj(cert.file, out)
-
-        cert_record = models.Certificate(
-            response_id=resp.id,
-            filename=cert.filename,
-            filepath=str(dest)
+    await db.flush()
+
+    # Disk copies are independent, so overlap them; the semaphore keeps a
+    # large upload from exhausting file descriptors or threadpool tokens
+    sem = asyncio.Semaphore(8)
+    written_paths = []
+
+    async def save_one(cert: UploadFile) -> str:
+        dest = f"{_UPLOAD_DIR_STR}/{uuid.uuid4().hex}.pdf"
+        async with sem:
+            with open(dest, "wb") as out:
+                written_paths.append(dest)
+                # Offload the blocking disk copy so it doesn't stall the event loop
+                await run_in_threadpool(_save_upload, cert.file, out)
+        return dest
+
+    try:
+        # return_exceptions keeps gather from unwinding while sibling copies
+        # are still writing, so every writer has finished (and registered its
+        # path for cleanup) before any failure is surfaced below
+        dests = await asyncio.gather(
+            *(save_one(cert) for cert in certificates), return_exceptions=True
         )
-        db.add(cert_record)
-        saved_filenames.append(cert.filename)
-
-    db.commit()
+        for dest in dests:
+            if isinstance(dest, BaseException):
+                raise dest
+        saved_filenames = [cert.filename for cert in certificates]
+        cert_rows = [
+            {"response_id": resp.id, "filename": cert.filename, "filepath": dest}
+            for cert, dest in zip(certificates, dests)
+        ]
+
+        # One multi-row INSERT instead of a statement per certificate
+        await db.execute(insert(models.Certificate), cert_rows)
+        await db.commit()
+    except Exception:
+        # Clean up anything written in this request before surfacing the error
+        for path in written_paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        await db.rollback()
+        raise
 
     return {
         "full_name": full_name,
@@ -164,15 +272,15 @@ async def submit_response(
         "gender": gender,
         "programming_stack": programming_stack,
         "certificates": {"certificate": saved_filenames},
-        "date_responded": resp.date_responded.strftime("%Y-%m-%d %H:%M:%S")
+        "date_responded": resp.date_responded.isoformat(sep=" ", timespec="seconds")
     }
 
 @app.get("/api/questions/responses", response_model=schemas.QuestionResponseList)
-def get_responses(
+async def get_responses(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     email_address: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get paginated list of submitted survey responses.
@@ -181,41 +289,72 @@ def get_responses(
         page (int): Page number (starts at 1).
         page_size (int): Number of items per page.
         email_address (Optional[str]): Filter responses by email.
-        db (Session): SQLAlchemy database session.
+        db (AsyncSession): SQLAlchemy async database session.
 
     Returns:
         dict: Pagination info and list of responses.
     """
-    query = db.query(models.Response)
+    # count(*) OVER () rides along with the page rows, so total and page
+    # come back in a single round-trip instead of a separate COUNT query
+    stmt = select(models.Response, func.count().over().label("total"))
     if email_address:
-        query = query.filter(models.Response.email_address == email_address)
+        stmt = stmt.filter(models.Response.email_address == email_address)
 
-    total = query.count()
     offset = (page - 1) * page_size
-    last_page = (total + page_size - 1) // page_size
 
-    records = (
-        query
-        .order_by(models.Response.date_responded.desc())
-        .offset(offset)
-        .limit(page_size)
-        .all()
-    )
+    rows = (
+        await db.execute(
+            stmt
+            .options(
+                # Project exactly the columns the payload serializes; loading
+                # certificates by id/filename skips the filepath varchar
+                load_only(
+                    models.Response.id,
+                    models.Response.full_name,
+                    models.Response.email_address,
+                    models.Response.description,
+                    models.Response.gender,
+                    models.Response.programming_stack,
+                    models.Response.date_responded,
+                ),
+                selectinload(models.Response.certificates).load_only(
+                    models.Certificate.id,
+                    models.Certificate.filename,
+                ),
+            )
+            .order_by(models.Response.date_responded.desc())
+            .offset(offset)
+            .limit(page_size)
+        )
+    ).all()
+
+    if rows:
+        total = rows[0].total
+    else:
+        # An empty page (offset past the end) carries no window count, so
+        # fall back to a plain COUNT for correct pagination metadata
+        count_stmt = select(func.count(models.Response.id))
+        if email_address:
+            count_stmt = count_stmt.filter(models.Response.email_address == email_address)
+        total = (await db.execute(count_stmt)).scalar()
 
-    result = []
-    for r in records:
-        certs = db.query(models.Certificate).filter_by(response_id=r.id).all()
-        cert_data = [{"id": c.id, "text": c.filename} for c in certs]
-        result.append({
+    last_page = (total + page_size - 1) // page_size
+
+    result = [
+        {
             "response_id": r.id,
             "full_name": r.full_name,
             "email_address": r.email_address,
             "description": r.description,
             "gender": r.gender,
             "programming_stack": r.programming_stack,
-            "certificates": {"certificate": cert_data},
-            "date_responded": r.date_responded.strftime("%Y-%m-%d %H:%M:%S")
-        })
+            "certificates": {
+                "certificate": [{"id": c.id, "text": c.filename} for c in r.certificates]
+            },
+            "date_responded": r.date_responded.isoformat(sep=" ", timespec="seconds")
+        }
+        for r, _ in rows
+    ]
 
     return {
         "current_page": page,
@@ -226,13 +365,13 @@ def get_responses(
     }
 
 @app.get("/api/questions/responses/certificates/{id}")
-def download_certificate(id: int, db: Session = Depends(get_db)):
+async def download_certificate(id: int, db: AsyncSession = Depends(get_db)):
     """
     Download a previously uploaded certificate by ID.
 
     Args:
         id (int): Certificate database ID.
-        db (Session): SQLAlchemy database session.
+        db (AsyncSession): SQLAlchemy async database session.
 
     Raises:
         HTTPException: If certificate is not found.
@@ -240,7 +379,12 @@ def download_certificate(id: int, db: Session = Depends(get_db)):
     Returns:
         FileResponse: PDF file response.
     """
-    cert = db.query(models.Certificate).filter_by(id=id).first()
+    cert = (
+        await db.execute(select(models.Certificate).filter_by(id=id))
+    ).scalars().first()
     if not cert:
         raise HTTPException(status_code=404, detail="Certificate not found")
-    return FileResponse(path=cert.filepath, filename=cert.filename, media_type="application/pdf")
\ No newline at end of file
+    response = FileResponse(path=cert.filepath, filename=cert.filename, media_type="application/pdf")
+    # Stream in 1 MiB chunks instead of Starlette's 64 KiB default
+    response.chunk_size = COPY_BUFSIZE
+    return response
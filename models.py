@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey # type: ignore
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index # type: ignore
 from sqlalchemy.orm import relationship # type: ignore
 from database import Base
 
@@ -37,7 +37,11 @@ class QuestionOption(Base):
     question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"))
     value = Column(String(100), nullable=False)
     text = Column(String(200), nullable=False)
-    
+
+    __table_args__ = (
+        Index("ix_qoptions_question_id", question_id),
+    )
+
     # Relationships
     question = relationship("Question", back_populates="options")
 
@@ -54,7 +58,14 @@ class Response(Base):
     gender = Column(String(20), nullable=False)
     programming_stack = Column(String(500), nullable=False)
     date_responded = Column(DateTime, nullable=False)
-    
+
+    # Newest-first listing is the hot query shape, with or without the
+    # email filter applied in front of it
+    __table_args__ = (
+        Index("ix_responses_date_desc", date_responded.desc()),
+        Index("ix_responses_email_date", email_address, date_responded.desc()),
+    )
+
     # Relationships
     certificates = relationship("Certificate", back_populates="response", cascade="all, delete-orphan")
 
@@ -68,6 +79,10 @@ class Certificate(Base):
     response_id = Column(Integer, ForeignKey("responses.id", ondelete="CASCADE"))
     filename = Column(String(255), nullable=False)
     filepath = Column(String(500), nullable=False)
-    
+
+    __table_args__ = (
+        Index("ix_certificates_response_id", response_id),
+    )
+
     # Relationships
     response = relationship("Response", back_populates="certificates")
\ No newline at end of file
@@ -1,133 +1,141 @@
-import sys
-from sqlalchemy.orm import Session  # type: ignore
-from database import get_db, engine, Base
+import asyncio
+from sqlalchemy import insert  # type: ignore
+from sqlalchemy.dialects.postgresql import insert as pg_insert  # type: ignore
+from database import SessionLocal, engine, Base
 import models
 
+# Static seed data, parsed once at import; plain dicts feed the insert
+# statements directly with no ORM instance construction
+QUESTIONS = (
+    {
+        "name": "full_name",
+        "type": "short_text",
+        "required": True,
+        "text": "What is your full name?",
+        "description": "[Surname] [First Name] [Other Names]"
+    },
+    {
+        "name": "email_address",
+        "type": "email",
+        "required": True,
+        "text": "What is your email address?",
+        "description": ""
+    },
+    {
+        "name": "description",
+        "type": "long_text",
+        "required": True,
+        "text": "Tell us a bit more about yourself",
+        "description": ""
+    },
+    {
+        "name": "gender",
+        "type": "choice",
+        "required": True,
+        "text": "What is your gender?",
+        "description": "",
+        "multiple_choice": False
+    },
+    {
+        "name": "programming_stack",
+        "type": "choice",
+        "required": True,
+        "text": "What programming stack are you familiar with?",
+        "description": "You can select multiple",
+        "multiple_choice": True
+    },
+    {
+        "name": "certificates",
+        "type": "file",
+        "required": True,
+        "text": "Upload any of your certificates?",
+        "description": "You can upload multiple (.pdf)",
+        "file_format": ".pdf",
+        "max_file_size": 1,
+        "max_file_size_unit": "mb",
+        "multiple_files": True
+    },
+)
 
-def has_questions() -> bool:
-    """Check if the database already contains any questions."""
-    db: Session = next(get_db())
-    try:
-        count = db.query(models.Question).count()
-        return count > 0
-    finally:
-        db.close()
-
-
-def seed_questions():
-    """Seed the database with initial questions."""
-    db: Session = next(get_db())
-    try:
-        # Question 1: Full Name
-        q1 = models.Question(
-            name="full_name",
-            type="short_text",
-            required=True,
-            text="What is your full name?",
-            description="[Surname] [First Name] [Other Names]"
-        )
-        db.add(q1)
-
-        # Question 2: Email Address
-        q2 = models.Question(
-            name="email_address",
-            type="email",
-            required=True,
-            text="What is your email address?",
-            description=""
-        )
-        db.add(q2)
-
-        # Question 3: Description
-        q3 = models.Question(
-            name="description",
-            type="long_text",
-            required=True,
-            text="Tell us a bit more about yourself",
-            description=""
-        )
-        db.add(q3)
+OPTIONS_BY_Q = {
+    "gender": (
+        {"value": "MALE", "text": "Male"},
+        {"value": "FEMALE", "text": "Female"},
+        {"value": "OTHER", "text": "Other"},
+    ),
+    "programming_stack": (
+        {"value": "REACT", "text": "React JS"},
+        {"value": "ANGULAR", "text": "Angular JS"},
+        {"value": "VUE", "text": "Vue JS"},
+        {"value": "SVELTE", "text": "Svelte"},
+        {"value": "SQL", "text": "SQL"},
+        {"value": "POSTGRES", "text": "Postgres"},
+        {"value": "MYSQL", "text": "MySQL"},
+        {"value": "MSSQL", "text": "Microsoft SQL Server"},
+        {"value": "JAVA", "text": "Java"},
+        {"value": "PHP", "text": "PHP"},
+        {"value": "GO", "text": "Go"},
+        {"value": "RUST", "text": "Rust"},
+        {"value": "PYTHON", "text": "Python"},
+    ),
+}
 
-        # Question 4: Gender
-        q4 = models.Question(
-            name="gender",
-            type="choice",
-            required=True,
-            text="What is your gender?",
-            description="",
-            multiple_choice=False
-        )
-        db.add(q4)
-        db.flush()
 
-        # Add gender options
-        gender_options = [
-            models.QuestionOption(question_id=q4.id, value="MALE", text="Male"),
-            models.QuestionOption(question_id=q4.id, value="FEMALE", text="Female"),
-            models.QuestionOption(question_id=q4.id, value="OTHER", text="Other")
-        ]
-        db.add_all(gender_options)
+async def seed_questions(db):
+    """
+    Seed the database with initial questions.
 
-        # Question 5: Programming Stack
-        q5 = models.Question(
-            name="programming_stack",
-            type="choice",
-            required=True,
-            text="What programming stack are you familiar with?",
-            description="You can select multiple",
-            multiple_choice=True
-        )
-        db.add(q5)
-        db.flush()
-
-        # Add programming stack options
-        stack_options = [
-            models.QuestionOption(question_id=q5.id, value="REACT", text="React JS"),
-            models.QuestionOption(question_id=q5.id, value="ANGULAR", text="Angular JS"),
-            models.QuestionOption(question_id=q5.id, value="VUE", text="Vue JS"),
-            models.QuestionOption(question_id=q5.id, value="SVELTE", text="Svelte"),
-            models.QuestionOption(question_id=q5.id, value="SQL", text="SQL"),
-            models.QuestionOption(question_id=q5.id, value="POSTGRES", text="Postgres"),
-            models.QuestionOption(question_id=q5.id, value="MYSQL", text="MySQL"),
-            models.QuestionOption(question_id=q5.id, value="MSSQL", text="Microsoft SQL Server"),
-            models.QuestionOption(question_id=q5.id, value="JAVA", text="Java"),
-            models.QuestionOption(question_id=q5.id, value="PHP", text="PHP"),
-            models.QuestionOption(question_id=q5.id, value="GO", text="Go"),
-            models.QuestionOption(question_id=q5.id, value="RUST", text="Rust"),
-            models.QuestionOption(question_id=q5.id, value="PYTHON", text="Python")
-        ]
-        db.add_all(stack_options)
+    Idempotent: questions upsert with ON CONFLICT (name) DO NOTHING, so
+    re-runs and parallel cold-starts are safe without a pre-check, and
+    option rows are only written for questions inserted by this run.
+    Parent Question ids come back from INSERT ... RETURNING, so no
+    intermediate flush is needed before inserting the option rows.
+    """
+    try:
+        # One explicit BEGIN...COMMIT around both inserts: a single fsync
+        # on commit, and rollback is automatic if anything fails
+        async with db.begin():
+            # One multi-row upsert for all questions; RETURNING only yields
+            # rows actually inserted, which scopes the option inserts below
+            ids = {
+                row.name: row.id
+                for row in await db.execute(
+                    # The ORM entity (not __table__) matters here: the dicts
+                    # have heterogeneous keys, and only the ORM-enabled insert
+                    # groups them so the per-question columns aren't dropped
+                    pg_insert(models.Question)
+                    .on_conflict_do_nothing(index_elements=["name"])
+                    .returning(models.Question.id, models.Question.name),
+                    list(QUESTIONS),
+                )
+            }
 
-        # Question 6: Certificates
-        q6 = models.Question(
-            name="certificates",
-            type="file",
-            required=True,
-            text="Upload any of your certificates?",
-            description="You can upload multiple (.pdf)",
-            file_format=".pdf",
-            max_file_size=1,
-            max_file_size_unit="mb",
-            multiple_files=True
-        )
-        db.add(q6)
+            option_rows = [
+                {"question_id": ids[name], **opt}
+                for name, opts in OPTIONS_BY_Q.items()
+                if name in ids
+                for opt in opts
+            ]
+            if option_rows:
+                await db.execute(insert(models.QuestionOption), option_rows)
 
-        db.commit()
-        print("Database seeded successfully with questions!")
+        if ids:
+            print("Database seeded successfully with questions!")
+        else:
+            print("Database already has questions. Skipping seeding.")
     except Exception as e:
-        db.rollback()
         print(f"Error seeding database: {e}")
         raise
-    finally:
-        db.close()
 
 
-if __name__ == "__main__":
-    # First, check if questions already exist
-    if has_questions():
-        print("Database already has questions. Skipping seeding.")
-        sys.exit(0)
+async def main():
+    # Create tables, then seed; the upsert makes re-runs and parallel
+    # cold-starts no-ops without a check-then-act race
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as db:
+        await seed_questions(db)
 
-    # Create tables and seed
-    Base.metadata.create_all(bind=engine)
-    seed_questions()
+
+if __name__ == "__main__":
+    asyncio.run(main())